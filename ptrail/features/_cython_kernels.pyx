@@ -0,0 +1,91 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+    This module contains the Cython implementation of the haversine kernels used
+    by the kinematic features. It is an optional extension that is built by setup.py
+    whenever Cython and a C compiler are available and it is used by the _kernels
+    module in preference to the other backends. The loops run without holding the GIL.
+
+    Warning
+    -------
+        These functions should not be used directly. Use the ones exposed by the
+        _kernels module instead.
+"""
+import numpy as np
+
+from libc.math cimport atan2, cos, sin, sqrt, NAN
+from libc.stdint cimport int64_t
+
+from ptrail.utilities import constants as const
+
+cdef double RADIUS_OF_EARTH = const.RADIUS_OF_EARTH
+
+
+cdef inline double _haversine(double lat1, double lon1, double cos_lat1,
+                              double lat2, double lon2, double cos_lat2) noexcept nogil:
+    """
+        Calculate the Great-Circle (Haversine) distance between 2 points given in radians
+        along with the precomputed cosines of their latitudes. The formula is the same as
+        the one in DistanceCalculator.FormulaLog.haversine_distance().
+    """
+    cdef double sin_lat = sin((lat2 - lat1) / 2.0)
+    cdef double sin_lon = sin((lon2 - lon1) / 2.0)
+    cdef double val_one = sin_lat * sin_lat + cos_lat1 * cos_lat2 * sin_lon * sin_lon
+
+    return (RADIUS_OF_EARTH * 2 * atan2(sqrt(val_one), sqrt(1 - val_one))) * 1000
+
+
+def haversine_pairs(const double[::1] lat1, const double[::1] lon1, const double[::1] cos_lat1,
+                    const double[::1] lat2, const double[::1] lon2, const double[::1] cos_lat2):
+    """
+        Calculate the Haversine distance between each pair of points
+        (lat1[i], lon1[i]) and (lat2[i], lon2[i]).
+    """
+    out = np.empty(lat2.shape[0])
+    cdef double[::1] out_view = out
+    cdef Py_ssize_t i
+
+    with nogil:
+        for i in range(lat2.shape[0]):
+            out_view[i] = _haversine(lat1[i], lon1[i], cos_lat1[i], lat2[i], lon2[i], cos_lat2[i])
+    return out
+
+
+def haversine_consecutive(const double[::1] lat, const double[::1] lon, const double[::1] cos_lat,
+                          const int64_t[::1] prev_positions, Py_ssize_t start):
+    """
+        Calculate the Haversine distance between each of the points starting from the
+        position start and the previous point of the same trajectory given by prev_positions
+        (see Helpers._get_previous_positions()). The distance of the first point of every
+        trajectory, marked by -1, is set to NaN.
+    """
+    out = np.empty(prev_positions.shape[0])
+    cdef double[::1] out_view = out
+    cdef Py_ssize_t i, k
+    cdef int64_t j
+
+    with nogil:
+        for i in range(prev_positions.shape[0]):
+            j = prev_positions[i]
+            if j < 0:
+                out_view[i] = NAN
+            else:
+                k = start + i
+                out_view[i] = _haversine(lat[j], lon[j], cos_lat[j], lat[k], lon[k], cos_lat[k])
+    return out
+
+
+def haversine_from_point(double lat0, double lon0, const double[::1] lat, const double[::1] lon,
+                         const double[::1] cos_lat):
+    """
+        Calculate the Haversine distance between the point (lat0, lon0) and
+        each of the points in the given arrays.
+    """
+    out = np.empty(lat.shape[0])
+    cdef double[::1] out_view = out
+    cdef double cos_lat0 = cos(lat0)
+    cdef Py_ssize_t i
+
+    with nogil:
+        for i in range(lat.shape[0]):
+            out_view[i] = _haversine(lat0, lon0, cos_lat0, lat[i], lon[i], cos_lat[i])
+    return out
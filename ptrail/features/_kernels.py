@@ -0,0 +1,197 @@
+"""
+    This module contains the numerical kernels used by the kinematic features for
+    calculating the Great-Circle (Haversine) distance over entire columns of a
+    dataframe in a single call instead of point by point.
+
+    The kernels are available with the following backends:
+        1. cython: The optional C extension built by setup.py when Cython is
+           available (see the _cython_kernels module).
+        2. numba: Compiled loops (see the _numba_kernels module).
+        3. numexpr: The haversine expression is evaluated by numexpr which avoids
+           the temporary arrays that NumPy creates for each of the operations.
+        4. numpy: Plain vectorized NumPy, which needs no extra dependency.
+
+    The first one of the above that is installed is used by default. A specific backend
+    can be selected by setting the PTRAIL_KERNEL_BACKEND environment variable to its name
+    before importing PTRAIL.
+
+    The cython and numba kernels release the GIL, hence with these backends large inputs
+    are split into slices that are run in parallel threads. The threads share the input
+    arrays and write into a single output array, so nothing is pickled or copied between
+    processes. The threads are joined before returning, so no thread is left running
+    when the multiprocessing pools used elsewhere in PTRAIL fork the process.
+
+    Warning
+    -------
+        These functions should not be used directly. They expect the coordinates as
+        contiguous float64 numpy arrays in radians along with the cosines of the latitudes
+        (see Helpers._get_coord_arrays()) and perform no validation of their inputs. For
+        calculation of features, use the ones in the kinematic_features module.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from math import ceil
+
+import numpy as np
+
+from ptrail.utilities import constants as const
+
+try:
+    from ptrail.features import _cython_kernels
+except ImportError:
+    _cython_kernels = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+BACKENDS = ['cython', 'numba', 'numexpr', 'numpy']
+AVAILABLE = {'cython': _cython_kernels is not None, 'numba': numba is not None,
+             'numexpr': numexpr is not None, 'numpy': True}
+
+BACKEND = os.environ.get('PTRAIL_KERNEL_BACKEND',
+                         next(name for name in BACKENDS if AVAILABLE[name])).lower()
+if BACKEND not in BACKENDS:
+    raise ValueError(f"Unknown kernel backend: {BACKEND}. Available backends are: {BACKENDS}")
+if not AVAILABLE[BACKEND]:
+    raise ImportError(f"The {BACKEND} kernel backend was selected but {BACKEND} is not installed.")
+
+# numexpr already evaluates the expressions in its own threads and the array
+# backends do not release the GIL for the entire calculation.
+THREADED = BACKEND in ['cython', 'numba']
+NUM_CPU = ceil((os.cpu_count() * 2) / 3)
+
+
+def _haversine_numpy(lat1, lon1, cos_lat1, lat2, lon2, cos_lat2):
+    """
+        Calculate the Haversine distance between the points (lat1, lon1) and
+        (lat2, lon2) with NumPy.
+    """
+    val_one = np.sin((lat2 - lat1) / 2.0) ** 2 + cos_lat1 * cos_lat2 * np.sin((lon2 - lon1) / 2.0) ** 2
+    crow_distance = 2 * np.arctan2(np.sqrt(val_one), np.sqrt(1 - val_one))
+
+    return (const.RADIUS_OF_EARTH * crow_distance) * 1000
+
+
+def _haversine_numexpr(lat1, lon1, cos_lat1, lat2, lon2, cos_lat2):
+    """
+        Calculate the Haversine distance between the points (lat1, lon1) and
+        (lat2, lon2) with numexpr.
+    """
+    val_one = numexpr.evaluate('sin((lat2 - lat1) / 2.0) ** 2 + cos_lat1 * cos_lat2 * sin((lon2 - lon1) / 2.0) ** 2')
+    return numexpr.evaluate('radius * 2 * arctan2(sqrt(val_one), sqrt(1 - val_one)) * 1000',
+                            local_dict={'val_one': val_one, 'radius': const.RADIUS_OF_EARTH})
+
+
+# The haversine used by the array backends. It is bound regardless of the selected
+# backend so that the functions below always refer to a defined name.
+_array_haversine_pairs = _haversine_numexpr if BACKEND == 'numexpr' else _haversine_numpy
+
+
+def _array_haversine_consecutive(lat, lon, cos_lat, prev_positions, start):
+    """
+        Calculate the Haversine distance between each of the points starting from the
+        position start and the previous point of the same trajectory given by
+        prev_positions with one of the array backends.
+    """
+    has_prev = prev_positions >= 0
+    prev = prev_positions[has_prev]
+    curr = np.flatnonzero(has_prev) + start
+
+    out = np.full(prev_positions.shape[0], np.nan)
+    out[has_prev] = _array_haversine_pairs(lat[prev], lon[prev], cos_lat[prev],
+                                           lat[curr], lon[curr], cos_lat[curr])
+    return out
+
+
+def _array_haversine_from_point(lat0, lon0, lat, lon, cos_lat):
+    """
+        Calculate the Haversine distance between the point (lat0, lon0) and
+        each of the points in the given arrays with one of the array backends.
+    """
+    return _array_haversine_pairs(lat0, lon0, np.cos(lat0), lat, lon, cos_lat)
+
+
+# Now, take the kernels of the selected backend.
+if BACKEND == 'cython':
+    from ptrail.features._cython_kernels import haversine_pairs as _pairs, \
+        haversine_consecutive as _consecutive, haversine_from_point as _from_point
+elif BACKEND == 'numba':
+    from ptrail.features._numba_kernels import haversine_pairs as _pairs, \
+        haversine_consecutive as _consecutive, haversine_from_point as _from_point
+else:
+    _pairs, _consecutive, _from_point = \
+        _array_haversine_pairs, _array_haversine_consecutive, _array_haversine_from_point
+
+
+def _run_in_threads(kernel, size, get_args):
+    """
+        Run the kernel over slices of the points in parallel threads, each of which writes
+        its results into its own part of a single preallocated output array. If the kernels
+        of the backend do not release the GIL or there are too few points, then the kernel
+        is run on all the points at once instead.
+
+        Parameters
+        ----------
+            kernel:
+                The kernel of the selected backend.
+            size: int
+                The total number of points.
+            get_args:
+                The function that returns the arguments of the kernel for the slice of the
+                points given by the start and stop positions.
+
+        Returns
+        -------
+            np.ndarray:
+                The results of the kernel for all the points.
+    """
+    num_threads = min(NUM_CPU, size // const.MIN_POINTS_PER_THREAD)
+    if not THREADED or num_threads < 2:
+        return kernel(*get_args(0, size))
+
+    out = np.empty(size)
+    bounds = np.linspace(0, size, num_threads + 1).astype(np.int64)
+
+    def run_slice(start, stop):
+        out[start:stop] = kernel(*get_args(start, stop))
+
+    with ThreadPoolExecutor(num_threads) as executor:
+        # Consume the results so that the exceptions raised in the threads are re-raised.
+        list(executor.map(run_slice, bounds[:-1], bounds[1:]))
+    return out
+
+
+def haversine_pairs(lat1, lon1, cos_lat1, lat2, lon2, cos_lat2):
+    """
+        Calculate the Haversine distance between each pair of points
+        (lat1[i], lon1[i]) and (lat2[i], lon2[i]).
+    """
+    return _run_in_threads(_pairs, lat2.shape[0],
+                           lambda start, stop: (lat1[start:stop], lon1[start:stop], cos_lat1[start:stop],
+                                                lat2[start:stop], lon2[start:stop], cos_lat2[start:stop]))
+
+
+def haversine_consecutive(lat, lon, cos_lat, prev_positions):
+    """
+        Calculate the Haversine distance between each point and the previous point of
+        the same trajectory given by prev_positions (see Helpers._get_previous_positions()).
+        The distance of the first point of every trajectory, marked by -1, is set to NaN.
+    """
+    return _run_in_threads(_consecutive, lat.shape[0],
+                           lambda start, stop: (lat, lon, cos_lat, prev_positions[start:stop], start))
+
+
+def haversine_from_point(lat0, lon0, lat, lon, cos_lat):
+    """
+        Calculate the Haversine distance between the point (lat0, lon0) and
+        each of the points in the given arrays.
+    """
+    return _run_in_threads(_from_point, lat.shape[0],
+                           lambda start, stop: (lat0, lon0, lat[start:stop], lon[start:stop], cos_lat[start:stop]))
@@ -0,0 +1,84 @@
+"""
+    This module contains the Numba implementation of the haversine kernels used
+    by the kinematic features. It is used by the _kernels module whenever numba
+    is installed and the Numba backend is selected.
+
+    Warning
+    -------
+        These functions should not be used directly. Use the ones exposed by the
+        _kernels module instead.
+"""
+import numpy as np
+from numba import njit
+
+from ptrail.utilities import constants as const
+
+# The kernels are compiled eagerly for the signatures given to njit, i.e. at import instead
+# of at their first call, and the compiled code is cached on disk for the later imports.
+# The kernels release the GIL so that slices of the points can be run in parallel threads.
+# The nnan and ninf flags are left out of fastmath on purpose as the first point of
+# every trajectory is assigned NaN and the data itself might contain NaN values.
+FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+@njit('f8(f8, f8, f8, f8, f8, f8)', cache=True, nogil=True, fastmath=FASTMATH)
+def _haversine(lat1, lon1, cos_lat1, lat2, lon2, cos_lat2):
+    """
+        Calculate the Great-Circle (Haversine) distance between 2 points given in radians
+        along with the precomputed cosines of their latitudes. The formula is the same as
+        the one in DistanceCalculator.FormulaLog.haversine_distance().
+
+        Returns
+        -------
+            float:
+                The distance between the 2 points in metres.
+    """
+    val_one = np.sin((lat2 - lat1) / 2.0) ** 2 + cos_lat1 * cos_lat2 * np.sin((lon2 - lon1) / 2.0) ** 2
+    crow_distance = 2 * np.arctan2(np.sqrt(val_one), np.sqrt(1 - val_one))
+
+    return (const.RADIUS_OF_EARTH * crow_distance) * 1000
+
+
+@njit('f8[::1](f8[::1], f8[::1], f8[::1], f8[::1], f8[::1], f8[::1])', cache=True, nogil=True, fastmath=FASTMATH)
+def haversine_pairs(lat1, lon1, cos_lat1, lat2, lon2, cos_lat2):
+    """
+        Calculate the Haversine distance between each pair of points
+        (lat1[i], lon1[i]) and (lat2[i], lon2[i]).
+    """
+    out = np.empty(lat2.shape[0])
+    for i in range(lat2.shape[0]):
+        out[i] = _haversine(lat1[i], lon1[i], cos_lat1[i], lat2[i], lon2[i], cos_lat2[i])
+    return out
+
+
+@njit('f8[::1](f8[::1], f8[::1], f8[::1], i8[::1], i8)', cache=True, nogil=True, fastmath=FASTMATH)
+def haversine_consecutive(lat, lon, cos_lat, prev_positions, start):
+    """
+        Calculate the Haversine distance between each of the points starting from the
+        position start and the previous point of the same trajectory given by prev_positions
+        (see Helpers._get_previous_positions()). The distance of the first point of every
+        trajectory, marked by -1, is set to NaN.
+    """
+    out = np.empty(prev_positions.shape[0])
+    for i in range(prev_positions.shape[0]):
+        j = prev_positions[i]
+        if j < 0:
+            out[i] = np.nan
+        else:
+            k = start + i
+            out[i] = _haversine(lat[j], lon[j], cos_lat[j], lat[k], lon[k], cos_lat[k])
+    return out
+
+
+@njit('f8[::1](f8, f8, f8[::1], f8[::1], f8[::1])', cache=True, nogil=True, fastmath=FASTMATH)
+def haversine_from_point(lat0, lon0, lat, lon, cos_lat):
+    """
+        Calculate the Haversine distance between the point (lat0, lon0) and
+        each of the points in the given arrays.
+    """
+    cos_lat0 = np.cos(lat0)
+    out = np.empty(lat.shape[0])
+    for i in range(lat.shape[0]):
+        out[i] = _haversine(lat0, lon0, cos_lat0, lat[i], lon[i], cos_lat[i])
+    return out
+
@@ -1,6 +1,8 @@
 """
-    This module contains all the helper functions for the parallel calculations in
-    the spatial and temporal features classes.
+    This module contains all the helper functions for the calculations in the
+    kinematic, temporal and contextual features classes. The kinematic helpers
+    calculate their features with a single vectorized pass over the entire
+    dataframe, whereas the temporal helpers are used for the parallel calculations.
 
     Warning
     -------
@@ -18,6 +20,7 @@ from math import ceil
 import numpy as np
 import pandas as pd
 
+from ptrail.features import _kernels as kernels
 from ptrail.utilities import constants as const
 from ptrail.utilities.DistanceCalculator import FormulaLog as calc
 
@@ -165,29 +168,17 @@ class Helpers:
                 Do M ́odulo De Pr ́e-processamento Para Biblioteca Pymove'.Bachelor’s thesis.
                 Universidade Federal Do Cear ́a, 2019.
         """
-        # Reset the index and set it to trajectory ID in order to iterate
-        # over the dataframe based on trajectory ID.
-        dataframe = dataframe.reset_index().set_index(const.TRAJECTORY_ID)
-        ids_ = dataframe.index.unique()  # Find out all the unique IDs in the dataframe.
-
-        # For each unique ID, calculate the haversine distance and then assign it to
-        # a new column and add that column to the dataframe.
-        for val in ids_:
-            curr_lat = dataframe.at[val, 'lat']
-            curr_lon = dataframe.at[val, 'lon']
-            size_id = curr_lat.size
-
-            # Check whether the IDs are changing in the dataset and if they are, then assign
-            # Nan as the value to the first point of the new Trajectory ID.
-            if size_id <= 1:
-                dataframe.at[val, 'Distance'] = np.nan
-            else:
-                prev_lat = curr_lat.shift(1)
-                prev_lon = curr_lon.shift(1)
-                dataframe.at[val, 'Distance'] = \
-                    calc.haversine_distance(prev_lat, prev_lon, curr_lat, curr_lon)
-
-        return dataframe.reset_index()  # Reset the index and return the dataframe.
+        # Reset the index and then take out the coordinates along with the trajectory IDs
+        # encoded as integers so that the kernel can detect when the trajectory ID changes.
+        dataframe = dataframe.reset_index()
+        lat, lon, cos_lat = Helpers._get_coord_arrays(dataframe)
+        traj_codes = Helpers._get_traj_codes(dataframe)
+        prev_positions = Helpers._get_previous_positions(traj_codes)
+
+        # Calculate the haversine distance between all the consecutive points at once. The
+        # first point of every Trajectory ID is assigned NaN by the kernel itself.
+        dataframe['Distance'] = kernels.haversine_consecutive(lat, lon, cos_lat, prev_positions)
+        return dataframe
 
     @staticmethod
     def distance_from_start_helper(dataframe):
@@ -208,38 +199,20 @@ class Helpers:
                 pandas.core.dataframe
                     The dataframe containing the resultant Distance_start_to_curr column.
         """
-        dataframe = dataframe.reset_index().set_index(const.TRAJECTORY_ID)
-        ids_ = dataframe.index.unique()  # Find out all the unique IDs in the dataframe.
-
-        # For each unique ID, calculate the haversine distance and then assign it to
-        # a new column and add that column to the dataframe.
-        for val in ids_:
-            curr_lat = dataframe.at[val, const.LAT]
-            curr_lon = dataframe.at[val, const.LONG]
-            size_id = curr_lat.size
-
-            # Here, the purpose of the if else statement is as follows:
-            #   In the above curr_lat variable, when the current latitude is extracted, sometimes
-            #   if the trajectory has only a single point, then it only returns a single float value
-            #   which naturally cannot be indexed. This if else statement checks if the value returned
-            #   by the curr_lat extraction is a float and if so, then dont try to index it and instead
-            #   take the value itself. The values are also shifted by 1 to avoid the distance calculation
-            #   yielding the value 0 and instead give out NaN.
-            start_lat = pd.Series(np.full(size_id,
-                                          curr_lat[0] if type(curr_lat) is not np.float64 else curr_lat)).shift(1)
-            start_lon = pd.Series(np.full(size_id,
-                                          curr_lon[0] if type(curr_lat) is not np.float64 else curr_lat)).shift(1)
-
-            # Check whether the IDs are changing in the dataset and if they are, then assign
-            # Nan as the value to the first point of the new Trajectory ID.
-            if size_id <= 1:
-                dataframe.at[val, 'Distance_from_start'] = np.nan
-
-            else:
-                dataframe.at[val, 'Distance_from_start'] = \
-                    calc.haversine_distance(start_lat, start_lon, curr_lat, curr_lon)
-
-        return dataframe.reset_index()  # Reset the index and return the dataframe.
+        # Reset the index and then find the position of the start point of the trajectory
+        # that each of the points belongs to.
+        dataframe = dataframe.reset_index()
+        lat, lon, cos_lat = Helpers._get_coord_arrays(dataframe)
+        traj_codes = Helpers._get_traj_codes(dataframe)
+        starts = Helpers._trajectory_start_positions(traj_codes)
+
+        # Calculate the haversine distance between the start point and all the points at once.
+        # The first point of every Trajectory ID is assigned NaN instead of 0.
+        distances = kernels.haversine_pairs(lat[starts], lon[starts], cos_lat[starts], lat, lon, cos_lat)
+        distances[starts == np.arange(len(starts))] = np.nan
+
+        dataframe['Distance_from_start'] = distances
+        return dataframe
 
     @staticmethod
     def distance_from_given_point_helper(dataframe, coordinates):
@@ -263,15 +236,12 @@ class Helpers:
         """
         # First, lets fetch the latitude and longitude columns from the dataset and store it
         # in a numpy array.
-        latitudes = np.array(dataframe[const.LAT])
-        longitudes = np.array(dataframe[const.LONG])
-        distances = np.zeros(len(latitudes))
+        lat, lon, cos_lat = Helpers._get_coord_arrays(dataframe)
 
-        # Now, lets calculate the Great-Circle (Haversine) distance between the 2 points and store
-        # each of the values in the distance numpy array.
-        for i in range(len(latitudes)):
-            distances[i] = calc.haversine_distance(coordinates[0], coordinates[1],
-                                                   latitudes[i], longitudes[i])
+        # Now, lets calculate the Great-Circle (Haversine) distance between the given point
+        # and all the points in the dataframe at once.
+        distances = kernels.haversine_from_point(np.radians(coordinates[0]), np.radians(coordinates[1]),
+                                                 lat, lon, cos_lat)
 
         dataframe[f'Distance_from_{coordinates}'] = distances
         return dataframe
@@ -298,16 +268,13 @@ class Helpers:
         """
         # First, lets fetch the latitude and longitude columns from the dataset and store it
         # in a numpy array.
-        latitudes = np.array(dataframe[const.LAT])
-        longitudes = np.array(dataframe[const.LONG])
-        distances = []
+        lat, lon, cos_lat = Helpers._get_coord_arrays(dataframe)
 
-        # Now, lets calculate the Great-Circle (Haversine) distance between the 2 points and then check
-        # whether the distance is within the user specified range and store each of the values in the \
-        # distance numpy array.
-        for i in range(len(latitudes)):
-            distances.append(calc.haversine_distance(coordinates[0], coordinates[1],
-                                                     latitudes[i], longitudes[i]) <= dist_range)
+        # Now, lets calculate the Great-Circle (Haversine) distance between the given point and
+        # all the points at once and then check whether the distance is within the user specified
+        # range.
+        distances = kernels.haversine_from_point(np.radians(coordinates[0]), np.radians(coordinates[1]),
+                                                 lat, lon, cos_lat) <= dist_range
 
         # Now, assign the column containing the results calculated above and
         # return the dataframe.
@@ -333,156 +300,23 @@ class Helpers:
                 PTRAILDataFrame:
                     The dataframe containing the Bearing column.
         """
-        # Reset the index and set it to trajectory ID in order to iterate
-        # over the dataframe based on trajectory ID.
-        dataframe = dataframe.reset_index().set_index(const.TRAJECTORY_ID)
-        ids_ = dataframe.index.unique()  # Find out all the unique IDs in the dataframe.
-
-        # For each unique ID, calculate the haversine distance and then assign it to
-        # a new column and add that column to the dataframe.
-        for val in ids_:
-            curr_lat = dataframe.at[val, 'lat']
-            curr_lon = dataframe.at[val, 'lon']
-            size_id = curr_lat.size
-
-            # Check whether the IDs are changing in the dataset and if they are, then assign
-            # Nan as the value to the first point of the new Trajectory ID.
-            if size_id <= 1:
-                dataframe.at[val, 'Bearing'] = np.nan
-            else:
-                prev_lat = curr_lat.shift(1)
-                prev_lon = curr_lon.shift(1)
-                dataframe.at[val, 'Bearing'] = \
-                    calc.bearing_calculation(prev_lat, prev_lon, curr_lat, curr_lon)
-
-        return dataframe.reset_index()
-
-    @staticmethod
-    def start_location_helper(dataframe, ids_):
-        """
-            This function is the helper function of the get_start_location(). The get_start_location() function
-            delegates the task of calculating the start location of the trajectories in the dataframe because the
-            original functions runs multiple instances of this function in parallel. This function finds the start
-            location of the specified trajectory IDs the DF and then another returns dataframe containing start
-            latitude, start longitude and trajectory ID for each trajectory
-
-
-            Parameter
-            ---------
-                dataframe: PTRAILDataFrame
-                    The dataframe of which the locations are to be found.dataframe
-                ids_: list
-                    List of trajectory ids for which the start locations are to be calculated
-
-            Returns
-            -------
-                pandas.core.dataframe.Dataframe
-                    New dataframe containing Trajectory as index and latitude and longitude
-        """
-        results = []
-
-        # Loops over the length of trajectory ids. Filter the dataframe according to each of the ids
-        # and then further filter that dataframe according to the earliest(minimum) time.
-        # And then append the start location of that earliest time into a list
-        for i in range(len(ids_)):
-            filt = (dataframe.loc[dataframe[const.TRAJECTORY_ID] == ids_[i],
-                                  [const.DateTime, const.LAT, const.LONG]])
-            start_loc = (filt.loc[filt[const.DateTime] == filt[const.DateTime].min(),
-                                  [const.LAT, const.LONG]]).reset_index()
-            results.append([start_loc[const.LAT][0], start_loc[const.LONG][0], ids_[i]])
-
-        # Make a new dataframe containing Latitude Longitude and Trajectory id
-        df = pd.DataFrame(results).reset_index(drop=True).rename(columns={0: const.LAT,
-                                                                          1: const.LONG,
-                                                                          2: const.TRAJECTORY_ID})
-
-        # Return the dataframe by setting Trajectory id as index
-        return df.set_index(const.TRAJECTORY_ID)
-
-    @staticmethod
-    def end_location_helper(dataframe, ids_):
-        """
-            This function is the helper function of the get_end_location(). The get_end_location() function
-            delegates the task of calculating the end location of the trajectories in the dataframe because the
-            original functions runs multiple instances of this function in parallel. This function finds the end
-            location of the specified trajectory IDs the DF and then another returns dataframe containing
-            end latitude, end longitude and trajectory ID for each trajectory
-
-            Parameter
-            ---------
-                dataframe: PTRAILDataFrame
-                    The dataframe of which the locations are to be found.dataframe
-                ids_: list
-                    List of trajectory ids for which the end locations are to be calculated
-
-            Returns
-            -------
-                pandas.core.dataframe.Dataframe
-                    New dataframe containing Trajectory ID as index and latitude and longitude
-                    as other 2 columns.
-        """
-        results = []
-
-        # Loops over the length of trajectory ids. Filter the dataframe according to each of the ids
-        # and then further filter that dataframe according to the latest(maximum) time.
-        # And then append the end location of that latest time into a list.
-        for i in range(len(ids_)):
-            filt = (dataframe.loc[dataframe[const.TRAJECTORY_ID] == ids_[i],
-                                  [const.DateTime, const.LAT, const.LONG]])
-            start_loc = (filt.loc[filt[const.DateTime] == filt[const.DateTime].max(),
-                                  [const.LAT, const.LONG]]).reset_index()
-            results.append([start_loc[const.LAT][0], start_loc[const.LONG][0], ids_[i]])
-
-        # Make a new dataframe containing Latitude Longitude and Trajectory id
-        df = pd.DataFrame(results).reset_index(drop=True).rename(columns={0: const.LAT,
-                                                                          1: const.LONG,
-                                                                          2: const.TRAJECTORY_ID})
-        # Return the dataframe by setting Trajectory id as index
-        return df.set_index(const.TRAJECTORY_ID)
-
-    @staticmethod
-    def number_of_location_helper(dataframe, ids_):
-        """
-            This is the helper function for the get_number_of_locations() function. The
-            get_number_of_locations() delegates the actual task of calculating the number of
-            unique locations visited by a particular object to this function. This function
-            calculates the number of unique locations by each of the unique object and returns
-            a dataframe containing the results.
-
-            Parameters
-            ----------
-                dataframe: PTRAILDataFrame
-                    The dataframe containing all the original data.
-                ids_: list
-                    The list of ids for which the number of unique locations visited
-                    is to be calculated.
-
-            Returns
-            -------
-                pandas.core.dataframe.DataFrame
-                    dataframe containing the results.
-        """
-        results = []  # A list for storing results.
-
-        # Iterate over each ID and calculate the number of locations visited by each ID.
-        for i in range(len(ids_)):
-            # Filter out only the points of the ID in question.
-            filt = (dataframe.loc[dataframe[const.TRAJECTORY_ID] == ids_[i],
-                                  [const.DateTime, const.LAT, const.LONG]])
-
-            # Calculate the total number of unique (lat, lon) points visited
-            # by the ID and append a row containing [# of unique locations, traj_id]
-            # to the results list.
-            results.append([filt.groupby([const.LAT, const.LONG]).ngroups, ids_[i]])
-
-        # Convert the list containing results to a pandas dataframe, reset the index
-        # and then rename the columns.
-        df = pd.DataFrame(results).reset_index(drop=True).rename(columns={0: "Number of Unique Coordinates",
-                                                                          1: const.TRAJECTORY_ID})
-        # Set the index to traj_id and return it.
-        return df.set_index(const.TRAJECTORY_ID)
+        # Reset the index and take out the coordinates along with the position of the
+        # previous point of the same trajectory for each of the points.
+        dataframe = dataframe.reset_index()
+        lat = dataframe[const.LAT].to_numpy(dtype=np.float64)
+        lon = dataframe[const.LONG].to_numpy(dtype=np.float64)
+        prev_positions = Helpers._get_previous_positions(pd.factorize(dataframe[const.TRAJECTORY_ID])[0])
+
+        # Calculate the bearing between all the consecutive points at once and write it into
+        # a preallocated array. The first point of every Trajectory ID is assigned NaN.
+        has_prev = prev_positions >= 0
+        prev = prev_positions[has_prev]
+        bearings = np.full(len(dataframe), np.nan)
+        bearings[has_prev] = calc.bearing_calculation(lat[prev], lon[prev], lat[has_prev], lon[has_prev])
+
+        dataframe['Bearing'] = bearings
+        return dataframe
 
-    # ------------------------------------ Semantic Helpers ------------------------------------- #
     @staticmethod
     def visited_poi_helper(df, surrounding_data, dist_column_label, nearby_threshold):
         """
@@ -532,6 +366,30 @@ class Helpers:
             raise KeyError(f"The column {dist_column_label} does not exist in the dataset.")
 
     # ------------------------------------ General Utilities ------------------------------------ #
+    @staticmethod
+    def _get_column_values(dataframe, column):
+        """
+            Get the values of a column of the dataframe as a numpy array without making a
+            copy of the entire dataframe. The column can either be a regular column or one
+            of the levels of the index as is the case with the DateTime and traj_id columns
+            of a PTRAILDataFrame.
+
+            Parameters
+            ----------
+                dataframe: PTRAILDataFrame
+                    The dataframe from which the values are to be taken.
+                column: Text
+                    The name of the column or the index level.
+
+            Returns
+            -------
+                np.ndarray:
+                    The values of the column.
+        """
+        if column in dataframe.columns:
+            return dataframe[column].to_numpy()
+        return dataframe.index.get_level_values(column).to_numpy()
+
     @staticmethod
     def _get_partition_size(size):
         """
@@ -564,6 +422,141 @@ class Helpers:
         # This factor hence is capped at 100.
         return factor if factor < 100 else 100
 
+    @staticmethod
+    def _get_time_deltas(dataframe, prev_positions):
+        """
+            Calculate the time difference in seconds between each point and the previous
+            point of the same trajectory. The difference is calculated on the int64
+            nanosecond values of the timestamps directly, which is both faster than going
+            through the .dt accessor of pandas and, unlike dt.seconds, does not wrap around
+            at day boundaries.
+
+            Parameters
+            ----------
+                dataframe: PTRAILDataFrame
+                    The dataframe containing the DateTime column or index level.
+                prev_positions: np.ndarray
+                    The position of the previous point of the same trajectory of each point.
+
+            Returns
+            -------
+                np.ndarray:
+                    The time differences in seconds. The first value of every trajectory is NaN.
+        """
+        times = Helpers._get_column_values(dataframe, const.DateTime).astype('datetime64[ns]').view('i8')
+        return Helpers._get_consecutive_diff(times, prev_positions) * 1e-9
+
+    @staticmethod
+    def _get_consecutive_diff(values, prev_positions):
+        """
+            Calculate the difference between the value of each point and the value of the
+            previous point of the same trajectory.
+
+            Parameters
+            ----------
+                values: np.ndarray
+                    The values of all the points.
+                prev_positions: np.ndarray
+                    The position of the previous point of the same trajectory of each point.
+
+            Returns
+            -------
+                np.ndarray:
+                    The differences. The first value of every trajectory is NaN.
+        """
+        has_prev = prev_positions >= 0
+        diffs = np.full(len(values), np.nan)
+        diffs[has_prev] = values[has_prev] - values[prev_positions[has_prev]]
+        return diffs
+
+    @staticmethod
+    def _get_coord_arrays(dataframe):
+        """
+            Take the coordinates of the points out of the dataframe in the form that is
+            expected by the compiled haversine kernels, i.e. separate contiguous arrays of
+            the latitudes and longitudes in radians and the cosines of the latitudes.
+
+            Note
+            ----
+                The cosine of the latitude of each point is precomputed here once as the
+                haversine formula would otherwise calculate it twice for each point.
+
+            Parameters
+            ----------
+                dataframe: PTRAILDataFrame
+                    The dataframe from which the coordinates are to be taken.
+
+            Returns
+            -------
+                tuple:
+                    The (lat, lon, cos_lat) tuple of numpy arrays.
+        """
+        lat = np.ascontiguousarray(np.radians(Helpers._get_column_values(dataframe, const.LAT)), dtype=np.float64)
+        lon = np.ascontiguousarray(np.radians(Helpers._get_column_values(dataframe, const.LONG)), dtype=np.float64)
+
+        return lat, lon, np.cos(lat)
+
+    @staticmethod
+    def _get_traj_codes(dataframe):
+        """
+            Get the trajectory IDs of the points of the dataframe encoded as integers.
+
+            Parameters
+            ----------
+                dataframe: PTRAILDataFrame
+                    The dataframe containing the traj_id column or index level.
+
+            Returns
+            -------
+                np.ndarray:
+                    The integer codes of the trajectory IDs.
+        """
+        return pd.factorize(Helpers._get_column_values(dataframe, const.TRAJECTORY_ID))[0]
+
+    @staticmethod
+    def _get_previous_positions(traj_codes):
+        """
+            Given the integer codes of the trajectory IDs of all the points, find the position
+            of the previous point of the same trajectory for each of the points.
+
+            Note
+            ----
+                The positions are found with a single groupby over the entire dataframe, hence
+                they are correct even if the points of a trajectory are not placed consecutively.
+
+            Parameters
+            ----------
+                traj_codes: np.ndarray
+                    The trajectory IDs of the points encoded as integers.
+
+            Returns
+            -------
+                np.ndarray:
+                    The position of the previous point of each point. The first point
+                    of every trajectory is assigned -1.
+        """
+        positions = pd.Series(np.arange(len(traj_codes), dtype=np.int64))
+        return positions.groupby(traj_codes, sort=False).shift(fill_value=-1).to_numpy()
+
+    @staticmethod
+    def _trajectory_start_positions(traj_codes):
+        """
+            Given the integer codes of the trajectory IDs of all the points, find the position
+            of the first point of the trajectory that each of the points belongs to.
+
+            Parameters
+            ----------
+                traj_codes: np.ndarray
+                    The trajectory IDs of the points encoded as integers.
+
+            Returns
+            -------
+                np.ndarray:
+                    The position of the start point of the trajectory of each point.
+        """
+        positions = pd.Series(np.arange(len(traj_codes), dtype=np.int64))
+        return positions.groupby(traj_codes, sort=False).transform('first').to_numpy()
+
     @staticmethod
     def _df_split_helper(dataframe):
         """
@@ -14,8 +14,6 @@
             Arina De Jesus Amador Monteiro Sanches. “Uma Arquitetura E Imple-menta ̧c ̃ao Do M ́odulo De
             Pr ́e-processamento Para Biblioteca Pymove”.Bachelor’s thesis. Universidade Federal Do Cear ́a, 2019
 """
-import itertools
-import multiprocessing
 import os
 from math import ceil
 from typing import Optional, Text
@@ -24,6 +22,7 @@ import numpy as np
 import pandas as pd
 
 from ptrail.core.TrajectoryDF import PTRAILDataFrame
+from ptrail.features import _kernels as kernels
 from ptrail.features.helper_functions import Helpers as helpers
 from ptrail.utilities import constants as const
 from ptrail.utilities.DistanceCalculator import FormulaLog as calc
@@ -51,12 +50,17 @@ class KinematicFeatures:
                 tuple:
                     The bounding box of the trajectory
         """
-        return (
-            dataframe[const.LAT].min(),
-            dataframe[const.LONG].min(),
-            dataframe[const.LAT].max(),
-            dataframe[const.LONG].max(),
-        )
+        # Take the raw arrays out of the dataframe and reduce them with NumPy directly
+        # instead of going through the aggregation machinery of pandas 4 times. The
+        # NaN skipping versions ignore the missing coordinates.
+        lat = dataframe[const.LAT].to_numpy(dtype=np.float64)
+        lon = dataframe[const.LONG].to_numpy(dtype=np.float64)
+
+        # The reductions of NumPy raise an error on empty arrays, so an empty
+        # dataframe has no bounding box.
+        if lat.size == 0:
+            return np.nan, np.nan, np.nan, np.nan
+        return np.nanmin(lat), np.nanmin(lon), np.nanmax(lat), np.nanmax(lon)
 
     @staticmethod
     def get_start_location(dataframe: PTRAILDataFrame, traj_id=None):
@@ -83,37 +87,29 @@ class KinematicFeatures:
                 pandas.core.dataframe.DataFrame:
                     The dataframe containing start locations of all trajectory IDs.
         """
-        # If traj_id is None, find the start times of all the unique trajectories present in the data.
-        # Else first filter out a dataframe containing the given traj_id and then return the start
-        # location of that point.
-        dataframe = dataframe.copy().reset_index()
+        # If traj_id is None, find the start locations of all the unique trajectories present in the data.
+        # Else find the position of the earliest point of the given traj_id and return its
+        # location. The dataframe is only read from, hence it is not copied.
+        traj_ids = helpers._get_column_values(dataframe, const.TRAJECTORY_ID)
+        times = helpers._get_column_values(dataframe, const.DateTime)
+        latitudes = helpers._get_column_values(dataframe, const.LAT)
+        longitudes = helpers._get_column_values(dataframe, const.LONG)
+
         if traj_id is None:
-            ids_ = dataframe[const.TRAJECTORY_ID].value_counts(ascending=True).keys().to_list()
-            # Get the ideal number of IDs by which the dataframe is to be split.
-            split_factor = helpers._get_partition_size(len(ids_))
-            ids_ = [ids_[i: i + split_factor] for i in range(0, len(ids_), split_factor)]
-
-            # Here, create 2/3rds number of processes as there are in the system. Some CPUs are
-            # kept free at all times in order to not block up the system.
-            # (Note: The blocking of system is mostly prevalent in Windows and does not happen very often
-            # in Linux. However, out of caution some CPUs are kept free regardless of the system.)
-            mp_pool = multiprocessing.Pool(NUM_CPU)
-            results = mp_pool.starmap(helpers.start_location_helper, zip(itertools.repeat(dataframe), ids_))
-            mp_pool.close()
-            mp_pool.join()
-
-            # Concatenate all the smaller dataframes and return the answer.
-            results = pd.concat(results)
+            # Find the position of the start point of each trajectory with a single groupby.
+            positions = pd.Series(times).groupby(traj_ids).idxmin().to_numpy()
+            results = pd.DataFrame({const.LAT: latitudes[positions],
+                                    const.LONG: longitudes[positions]},
+                                   index=pd.Index(traj_ids[positions], name=const.TRAJECTORY_ID))
             return results
 
         else:
-            filt = (dataframe.loc[dataframe[const.TRAJECTORY_ID] == traj_id, [const.DateTime, const.LAT, const.LONG]])
-            start_loc = (filt.loc[filt[const.DateTime] == filt[const.DateTime].min(),
-                                  [const.LAT, const.LONG]]).reset_index()
-            if len(start_loc) == 0:
+            rows = np.flatnonzero(traj_ids == traj_id)
+            if len(rows) == 0:
                 return f"Trajectory ID: {traj_id} does not exist in the dataset. Please try again!"
             else:
-                return start_loc[const.LAT][0], start_loc[const.LONG][0]
+                position = rows[times[rows].argmin()]
+                return latitudes[position], longitudes[position]
 
     @staticmethod
     def get_end_location(dataframe: PTRAILDataFrame, traj_id: Optional[Text] = None):
@@ -140,36 +136,29 @@ class KinematicFeatures:
                 pandas.core.dataframe.DataFrame:
                     The dataframe containing start locations of all trajectory IDs.
         """
-        # If traj_id is None, find the end times of all the unique trajectories present in the data.
-        # Else first filter out a dataframe containing the given traj_id and then return the end
-        # location of that point.
-        dataframe = dataframe.copy().reset_index()
+        # If traj_id is None, find the end locations of all the unique trajectories present in the data.
+        # Else find the position of the latest point of the given traj_id and return its
+        # location. The dataframe is only read from, hence it is not copied.
+        traj_ids = helpers._get_column_values(dataframe, const.TRAJECTORY_ID)
+        times = helpers._get_column_values(dataframe, const.DateTime)
+        latitudes = helpers._get_column_values(dataframe, const.LAT)
+        longitudes = helpers._get_column_values(dataframe, const.LONG)
+
         if traj_id is None:
-            ids_ = dataframe[const.TRAJECTORY_ID].value_counts(ascending=True).keys().to_list()
-            # Get the ideal number of IDs by which the dataframe is to be split.
-            split_factor = helpers._get_partition_size(len(ids_))
-            ids_ = [ids_[i: i + split_factor] for i in range(0, len(ids_), split_factor)]
-
-            # Here, create 2/3rds number of processes as there are in the system. Some CPUs are
-            # kept free at all times in order to not block up the system.
-            # (Note: The blocking of system is mostly prevalent in Windows and does not happen very often
-            # in Linux. However, out of caution some CPUs are kept free regardless of the system.)
-            mp_pool = multiprocessing.Pool(NUM_CPU)
-            results = mp_pool.starmap(helpers.end_location_helper, zip(itertools.repeat(dataframe), ids_))
-            mp_pool.close()
-            mp_pool.join()
-
-            # Concatenate all the smaller dataframes and return the answer.
-            results = pd.concat(results)
+            # Find the position of the end point of each trajectory with a single groupby.
+            positions = pd.Series(times).groupby(traj_ids).idxmax().to_numpy()
+            results = pd.DataFrame({const.LAT: latitudes[positions],
+                                    const.LONG: longitudes[positions]},
+                                   index=pd.Index(traj_ids[positions], name=const.TRAJECTORY_ID))
             return results
+
         else:
-            filt = (dataframe.loc[dataframe[const.TRAJECTORY_ID] == traj_id, [const.DateTime, const.LAT, const.LONG]])
-            start_loc = (filt.loc[filt[const.DateTime] == filt[const.DateTime].max(),
-                                  [const.LAT, const.LONG]]).reset_index()
-            if len(start_loc) == 0:
+            rows = np.flatnonzero(traj_ids == traj_id)
+            if len(rows) == 0:
                 return f"Trajectory ID: {traj_id} does not exist in the dataset. Please try again!"
             else:
-                return start_loc[const.LAT][0], start_loc[const.LONG][0]
+                position = rows[times[rows].argmax()]
+                return latitudes[position], longitudes[position]
 
     @staticmethod
     def create_distance_column(dataframe: PTRAILDataFrame):
@@ -198,28 +187,12 @@ class KinematicFeatures:
                 PTRAILDataFrame:
                     The dataframe containing the resultant Distance_prev_to_curr column.
         """
-        # Case-1: The number of unique Trajectory IDs is less than 100.
-        if dataframe.reset_index().traj_id.nunique() < const.MIN_IDS:
-            result = helpers.distance_between_consecutive_helper(dataframe)
-            return PTRAILDataFrame(result, const.LAT, const.LONG,
-                                   const.DateTime, const.TRAJECTORY_ID)
-        # Case-2: The number of unique Trajectory IDs is significant.
-        else:
-            # splitting the dataframe according to trajectory ids.
-            df_chunks = helpers._df_split_helper(dataframe)
-
-            # Here, create 2/3rds number of processes as there are in the system. Some CPUs are
-            # kept free at all times in order to not block up the system.
-            # (Note: The blocking of system is mostly prevalent in Windows and does not happen very often
-            # in Linux. However, out of caution some CPUs are kept free regardless of the system.)
-            multi_pool = multiprocessing.Pool(NUM_CPU)
-            result = multi_pool.map(helpers.distance_between_consecutive_helper, df_chunks)
-            multi_pool.close()
-            multi_pool.join()
-
-            # merge the smaller pieces and then return the dataframe converted to PTRAILDataFrame.
-            return PTRAILDataFrame(pd.concat(result).drop(columns=['index']), const.LAT, const.LONG,
-                                   const.DateTime, const.TRAJECTORY_ID)
+        # The compiled kernel calculates the distances of the entire dataframe in a single
+        # call regardless of the number of trajectories, hence the dataframe is no longer
+        # split into chunks and processed in parallel.
+        result = helpers.distance_between_consecutive_helper(dataframe)
+        return PTRAILDataFrame(result, const.LAT, const.LONG,
+                               const.DateTime, const.TRAJECTORY_ID)
 
     @staticmethod
     def create_distance_from_start_column(dataframe: PTRAILDataFrame):
@@ -248,29 +221,11 @@ class KinematicFeatures:
                 PTRAILDataFrame:
                     The dataframe containing the resultant Distance_start_to_curr column.
         """
-        # Case-1: The number of unique Trajectory IDs is less than 100.
-        if dataframe.reset_index().traj_id.nunique() < const.MIN_IDS:
-            result = helpers.distance_from_start_helper(dataframe)
-            return PTRAILDataFrame(result, const.LAT, const.LONG,
-                                   const.DateTime, const.TRAJECTORY_ID)
-
-        # Case-2: The number of unique Trajectory IDs is significant.
-        else:
-            # splitting the dataframe according to trajectory ids.
-            df_chunks = helpers._df_split_helper(dataframe)
-
-            # Here, create 2/3rds number of processes as there are in the system. Some CPUs are
-            # kept free at all times in order to not block up the system.
-            # (Note: The blocking of system is mostly prevalent in Windows and does not happen very often
-            # in Linux. However, out of caution some CPUs are kept free regardless of the system.)
-            multi_pool = multiprocessing.Pool(NUM_CPU)
-            result = multi_pool.map(helpers.distance_from_start_helper, df_chunks)
-            multi_pool.close()
-            multi_pool.join()
-
-            # merge the smaller pieces and then return the dataframe converted to PTRAILDataFrame.
-            return PTRAILDataFrame(pd.concat(result).drop(columns=['index']), const.LAT, const.LONG,
-                                   const.DateTime, const.TRAJECTORY_ID)
+        # Calculate the distances of the entire dataframe with a single call to the
+        # compiled kernel instead of splitting it up and forking processes.
+        result = helpers.distance_from_start_helper(dataframe)
+        return PTRAILDataFrame(result, const.LAT, const.LONG,
+                               const.DateTime, const.TRAJECTORY_ID)
 
     @staticmethod
     def distance_travelled_by_date_and_traj_id(dataframe: PTRAILDataFrame, date, traj_id):
@@ -301,25 +256,24 @@ class KinematicFeatures:
                 KeyError:
                     Traj_id is not present in the arguments passed.
         """
-        # First, reset the index of the dataframe.
-        # Then, filter the dataframe based on Date and Trajectory ID if given by user.
-        dataframe = dataframe.reset_index()
-        filt = dataframe.loc[dataframe[const.DateTime].dt.date == pd.to_datetime(date)]
-        small = filt.loc[filt[const.TRAJECTORY_ID] == traj_id]
+        # First, filter the points based on the Date and the Trajectory ID in a single boolean
+        # operation. The date is compared as a datetime64 day instead of creating a date object
+        # for each of the points.
+        day = np.datetime64(pd.to_datetime(date).date(), 'D')
+        days = helpers._get_column_values(dataframe, const.DateTime).astype('datetime64[D]')
+        mask = (days == day) & (helpers._get_column_values(dataframe, const.TRAJECTORY_ID) == traj_id)
 
-        if len(small) > 0:
+        if mask.any():
             # First, lets fetch the latitude and longitude columns from the dataset and store it
             # in a numpy array.
-            traj_ids = np.array(small.reset_index()[const.TRAJECTORY_ID])
-            latitudes = np.array(small[const.LAT])
-            longitudes = np.array(small[const.LONG])
-            distances = np.zeros(len(traj_ids))
+            latitudes = helpers._get_column_values(dataframe, const.LAT)[mask]
+            longitudes = helpers._get_column_values(dataframe, const.LONG)[mask]
 
-            # Now, lets calculate the Great-Circle (Haversine) distance between the 2 points and store
-            # each of the values in the distance numpy array.
-            for i in range(len(latitudes) - 1):
-                distances[i + 1] = calc.haversine_distance(latitudes[i], longitudes[i],
-                                                           latitudes[i + 1], longitudes[i + 1])
+            # Now, lets calculate the Great-Circle (Haversine) distance between all the consecutive
+            # points in one vectorized call. All the points belong to the same trajectory, hence no
+            # distance crosses a change in the trajectory ID.
+            distances = calc.haversine_distance(latitudes[:-1], longitudes[:-1],
+                                                latitudes[1:], longitudes[1:])
 
             return np.sum(distances)  # Sum all the distances and return the total path length.
         else:
@@ -352,23 +306,11 @@ class KinematicFeatures:
                 PTRAILDataFrame:
                     The dataframe containing the resultant Within_x_m_from_(x,y) column.
         """
-        # splitting the dataframe according to trajectory ids
-        df_chunks = helpers._df_split_helper(dataframe)
-
-        # Here, create 2/3rds number of processes as there are in the system. Some CPUs are
-        # kept free at all times in order to not block up the system.
-        # (Note: The blocking of system is mostly prevalent in Windows and does not happen very often
-        # in Linux. However, out of caution some CPUs are kept free regardless of the system.)
-        pool = multiprocessing.Pool(NUM_CPU)
-        args = zip(df_chunks, itertools.repeat(coordinates), itertools.repeat(dist_range))
-        result = pool.starmap(helpers.point_within_range_helper, args)
-        pool.close()
-        pool.join()
-
-        # Now lets join all the smaller partitions and return the resultant dataframe
-        result = pd.concat(result)
-        return PTRAILDataFrame(result.reset_index().drop(columns=['index']),
-                               const.LAT, const.LONG, const.DateTime, const.TRAJECTORY_ID)
+        # Calculate the distance between the given point and all the points of the dataframe
+        # with a single call to the compiled kernel and then mark the points whose distance
+        # is within the given range with a boolean mask.
+        result = helpers.point_within_range_helper(dataframe.reset_index(), coordinates, dist_range)
+        return PTRAILDataFrame(result, const.LAT, const.LONG, const.DateTime, const.TRAJECTORY_ID)
 
     @staticmethod
     def create_distance_from_point_column(dataframe: PTRAILDataFrame, coordinates: tuple):
@@ -392,25 +334,42 @@ class KinematicFeatures:
                 PTRAILDataFrame:
                     The dataframe containing the resultant Distance_from_(x, y) column.
         """
-        # dataframe = dataframe.reset_index()
-        # splitting the dataframe according to trajectory ids
-        df_chunks = helpers._df_split_helper(dataframe)
+        # Calculate the distance between the given point and all the points of the
+        # dataframe with a single call to the compiled kernel and then return the
+        # answer dataframe converted to PTRAILDataFrame.
+        answer = helpers.distance_from_given_point_helper(dataframe.reset_index(), coordinates)
+        return PTRAILDataFrame(answer, const.LAT, const.LONG, const.DateTime, const.TRAJECTORY_ID)
+
+    @staticmethod
+    def create_kinematic_columns(dataframe: PTRAILDataFrame):
+        """
+            Create the Distance, Speed, Acceleration and Jerk columns with a single pass
+            over the data instead of calculating each of them one after the other.
+
+            Note
+            ----
+                When the trajectory ID changes in the data, then the calculation again starts
+                from the first point of the new trajectory ID and the values of the first points
+                of the new trajectory ID will be set to NaN.
 
-        # Here, create 2/3rds number of processes as there are in the system. Some CPUs are
-        # kept free at all times in order to not block up the system.
-        # (Note: The blocking of system is mostly prevalent in Windows and does not happen very often
-        # in Linux. However, out of caution some CPUs are kept free regardless of the system.)
-        pool = multiprocessing.Pool(NUM_CPU)
-        answer = pool.starmap(helpers.distance_from_given_point_helper, zip(df_chunks, itertools.repeat(coordinates)))
-        pool.close()
-        pool.join()
+            Note
+            ----
+                The distance yielded is in metres (m), the speed in metres/second (m/s), the
+                acceleration in metres/second^2 (m/s^2) and the jerk in metres/second^3 (m/s^3).
 
-        # Now lets join all the smaller partitions and then add the Distance to the
-        # specific point column.
-        answer = pd.concat(answer)
+            Parameters
+            ----------
+                dataframe: PTRAILDataFrame
+                    The dataframe on which the kinematic features are to be calculated.
 
-        # return the answer dataframe converted to PTRAILDataFrame.
-        return PTRAILDataFrame(answer.reset_index(), const.LAT, const.LONG, const.DateTime, const.TRAJECTORY_ID)
+            Returns
+            -------
+                PTRAILDataFrame:
+                    The dataframe containing the resultant Distance, Speed, Acceleration
+                    and Jerk columns.
+        """
+        return KinematicFeatures._kinematic_columns_helper(dataframe,
+                                                           ['Distance', 'Speed', 'Acceleration', 'Jerk'])
 
     @staticmethod
     def create_speed_column(dataframe: PTRAILDataFrame):
@@ -439,46 +398,7 @@ class KinematicFeatures:
                 PTRAILDataFrame:
                     The dataframe containing the resultant Speed_prev_to_curr column.
         """
-        # Here, we are using try and catch blocks to check whether the DataFrame has the
-        # Distance_prev_to_curr column.
-        try:
-            # If the Distance_prev_to_curr column is already present in the dataframe,
-            # then extract it, calculate the time differences between the consecutive
-            # rows in the dataframe and then calculate distances/time_deltas in order to
-            # calculate the speed.
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
-            distances = dataframe.reset_index()['Distance']
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
-
-            # Assign the new column and return the NumPandasTrajDF.
-            dataframe['Speed'] = (distances / time_deltas.dropna()).to_numpy()
-            dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
-            return PTRAILDataFrame(data_set=dataframe.reset_index(),
-                                   datetime='DateTime',
-                                   traj_id='traj_id',
-                                   latitude='lat',
-                                   longitude='lon')
-        except KeyError:
-            # If the Distance_prev_to_curr column is not present in the Dataframe and a KeyError
-            # is thrown, then catch it and the overridden behaviour is as follows:
-            #   1. Calculate the distance by calling the create_distance_column() function.
-            #   2. Calculate the time deltas.
-            #   3. Divide the 2 values to calculate the speed.
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
-            dataframe = KinematicFeatures.create_distance_column(dataframe)
-            distances = dataframe.reset_index()['Distance']
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
-
-            # Assign the column and return the NumPandasTrajDF.
-            dataframe['Speed'] = (distances / time_deltas).to_numpy(dtype=np.float64)
-            dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
-            return PTRAILDataFrame(data_set=dataframe.reset_index(),
-                                   datetime='DateTime',
-                                   traj_id='traj_id',
-                                   latitude='lat',
-                                   longitude='lon')
+        return KinematicFeatures._kinematic_columns_helper(dataframe, ['Distance', 'Speed'])
 
     @staticmethod
     def create_acceleration_column(dataframe: PTRAILDataFrame):
@@ -501,40 +421,7 @@ class KinematicFeatures:
                 PTRAILDataFrame:
                     The dataframe containing the resultant Acceleration_prev_to_curr column.
         """
-        # Try catch is used to check if speed column is present or not
-        try:
-            # When Speed column is present extract the data from there and then take calculate the time delta
-            # And use that to calculate acceleration by dividing speed by time delta and then add the column to
-            # the dataframe
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
-            speed_deltas = dataframe.reset_index()['Speed'].diff()
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
-
-            dataframe['Acceleration'] = (speed_deltas / time_deltas).to_numpy()
-            dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
-            return PTRAILDataFrame(data_set=dataframe.reset_index(),
-                                   datetime='DateTime',
-                                   traj_id='traj_id',
-                                   latitude='lat',
-                                   longitude='lon')
-
-        except KeyError:
-            # When Speed column is not present then first call create_speed_from_prev_column() function to make
-            # the speed column and then follow the steps mentioned above
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
-            dataframe = KinematicFeatures.create_speed_column(dataframe)
-            speed_deltas = dataframe.reset_index()['Speed'].diff()
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
-
-            dataframe['Acceleration'] = (speed_deltas / time_deltas).to_numpy()
-            dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
-            return PTRAILDataFrame(data_set=dataframe.reset_index(),
-                                   datetime='DateTime',
-                                   traj_id='traj_id',
-                                   latitude='lat',
-                                   longitude='lon')
+        return KinematicFeatures._kinematic_columns_helper(dataframe, ['Distance', 'Speed', 'Acceleration'])
 
     @staticmethod
     def create_jerk_column(dataframe: PTRAILDataFrame):
@@ -557,40 +444,61 @@ class KinematicFeatures:
                 PTRAILDataFrame:
                     The dataframe containing the resultant jerk_prev_to_curr column.
         """
-        # Try catch is used to check if acceleration column is present or not
-        try:
-            # When acceleration column is present extract the data from there and then take calculate the time delta
-            # And use that to calculate acceleration by dividing speed_delta by time delta and then add the column to
-            # the dataframe
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
-            acceleration_deltas = dataframe.reset_index()['Acceleration'].diff()
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
-
-            dataframe['Jerk'] = (acceleration_deltas / time_deltas).to_numpy()
-            dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
-            return PTRAILDataFrame(data_set=dataframe.reset_index(),
-                                   datetime='DateTime',
-                                   traj_id='traj_id',
-                                   latitude='lat',
-                                   longitude='lon')
-
-        except KeyError:
-            # When Speed column is not present then first call create_speed_from_prev_column() function to make
-            # the speed column and then follow the steps mentioned above
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
-            dataframe = KinematicFeatures.create_acceleration_column(dataframe)
-            acceleration_deltas = dataframe.reset_index()['Acceleration'].diff()
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
-
-            dataframe['Jerk'] = (acceleration_deltas / time_deltas).to_numpy()
-            dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
-            return PTRAILDataFrame(data_set=dataframe.reset_index(),
-                                   datetime='DateTime',
-                                   traj_id='traj_id',
-                                   latitude='lat',
-                                   longitude='lon')
+        # The jerk requires all the other kinematic columns, hence this is the same as
+        # creating all the kinematic columns at once.
+        return KinematicFeatures.create_kinematic_columns(dataframe)
+
+    @staticmethod
+    def _kinematic_columns_helper(dataframe: PTRAILDataFrame, columns: list):
+        """
+            Calculate the distance, speed, acceleration and jerk between the consecutive
+            points in a single vectorized pass and assign the requested columns to the
+            dataframe all at once.
+
+            Note
+            ----
+                If the Distance column is already present in the dataframe, then it is used
+                as it is instead of being calculated again.
+
+            Parameters
+            ----------
+                dataframe: PTRAILDataFrame
+                    The dataframe on which the calculation is to be done.
+                columns: list
+                    The kinematic columns that are to be assigned to the dataframe.
+
+            Returns
+            -------
+                PTRAILDataFrame:
+                    The dataframe containing the requested kinematic columns.
+        """
+        # Reset the index only once and take the underlying arrays out of it.
+        dataframe = dataframe.reset_index()
+        lat, lon, cos_lat = helpers._get_coord_arrays(dataframe)
+        traj_codes = helpers._get_traj_codes(dataframe)
+        prev_positions = helpers._get_previous_positions(traj_codes)
+        if 'Distance' in dataframe.columns:
+            distances = dataframe['Distance'].to_numpy(dtype=np.float64)
+        else:
+            distances = kernels.haversine_consecutive(lat, lon, cos_lat, prev_positions)
+
+        time_deltas = helpers._get_time_deltas(dataframe, prev_positions)
+
+        # Now, calculate the speed, acceleration and jerk one after the other. Since the first
+        # value of every trajectory is NaN, the NaN values propagate to the next features by
+        # themselves. The values yielded by division by a time delta of 0 are set to NaN.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            speed = distances / time_deltas
+            speed[np.isinf(speed)] = np.nan
+            acceleration = helpers._get_consecutive_diff(speed, prev_positions) / time_deltas
+            acceleration[np.isinf(acceleration)] = np.nan
+            jerk = helpers._get_consecutive_diff(acceleration, prev_positions) / time_deltas
+            jerk[np.isinf(jerk)] = np.nan
+
+        kinematics = {'Distance': distances, 'Speed': speed, 'Acceleration': acceleration, 'Jerk': jerk}
+        dataframe = dataframe.assign(**{col: kinematics[col] for col in columns})
+        return PTRAILDataFrame(dataframe, const.LAT, const.LONG,
+                               const.DateTime, const.TRAJECTORY_ID)
 
     @staticmethod
     def create_bearing_column(dataframe: PTRAILDataFrame):
@@ -617,38 +525,12 @@ class KinematicFeatures:
                 PTRAILDataFrame:
                         The dataframe containing the resultant Bearing_from_prev column.
         """
-        # if cpu_count <= 1:
-        #     cpu_count = 1
-        # elif cpu_count >= NUM_CPU:
-        #     cpu_count = NUM_CPU - 1
-        # else:
-        #     cpu_count = cpu_count
-
-        # Case-1: The number of unique Trajectory IDs is less than x.
-        if dataframe.reset_index().traj_id.nunique() < const.MIN_IDS:
-            result = helpers.bearing_helper(dataframe)
-            return PTRAILDataFrame(result, const.LAT, const.LONG,
-                                   const.DateTime, const.TRAJECTORY_ID)
-
-        # Case-2: The number unique Trajectory IDs is significant.
-        else:
-            # splitting the dataframe according to trajectory ids.
-            df_chunks = helpers._df_split_helper(dataframe)
-
-            # Here, create 2/3rds number of processes as there are in the system. Some CPUs are
-            # kept free at all times in order to not block up the system.
-            # (Note: The blocking of system is mostly prevalent in Windows and does not happen very often
-            # in Linux. However, out of caution some CPUs are kept free regardless of the system.)
-            multi_pool = multiprocessing.Pool(NUM_CPU)
-            result = multi_pool.map(helpers.bearing_helper, df_chunks)
-            multi_pool.close()
-            multi_pool.join()
-
-            # merge the smaller pieces and then return the dataframe converted to PTRAILDataFrame.
-            dataframe = pd.concat(result).drop(columns=['index'])
-            dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
-            return PTRAILDataFrame(dataframe, const.LAT, const.LONG,
-                                   const.DateTime, const.TRAJECTORY_ID)
+        # The bearing of the entire dataframe is calculated with a single vectorized call
+        # and written into one preallocated column, hence the dataframe is no longer split
+        # into chunks and concatenated back together.
+        result = helpers.bearing_helper(dataframe)
+        return PTRAILDataFrame(result, const.LAT, const.LONG,
+                               const.DateTime, const.TRAJECTORY_ID)
 
     @staticmethod
     def create_bearing_rate_column(dataframe: PTRAILDataFrame):
@@ -671,38 +553,8 @@ class KinematicFeatures:
                 PTRAILDataFrame:
                     The dataframe containing the resultant Bearing_rate_from_prev column.
         """
-        # Try catch to check for Bearing column
-        try:
-            # If Bearing from previous column is present, extract that and then calculate time_deltas
-            # Using these calculate Bearing_rate_from_prev by dividing bearing_deltas with time_deltas
-            # And then adding the column to the dataframe
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
-            bearing_deltas = dataframe.reset_index()['Bearing'].diff()
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
-
-            dataframe['Bearing_Rate'] = (bearing_deltas / time_deltas).to_numpy()
-            dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
-            return PTRAILDataFrame(data_set=dataframe.reset_index(),
-                                   datetime='DateTime',
-                                   traj_id='traj_id',
-                                   latitude='lat',
-                                   longitude='lon')
-        except KeyError:
-            # Similar to the step above but just makes the Bearing column first
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
-            dataframe = KinematicFeatures.create_bearing_column(dataframe)
-            bearing_deltas = dataframe.reset_index()['Bearing'].diff()
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
-
-            dataframe['Bearing_Rate'] = (bearing_deltas / time_deltas).to_numpy()
-            dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
-            return PTRAILDataFrame(data_set=dataframe.reset_index(),
-                                   datetime='DateTime',
-                                   traj_id='traj_id',
-                                   latitude='lat',
-                                   longitude='lon')
+        return KinematicFeatures._rate_column_helper(dataframe, 'Bearing', 'Bearing_Rate',
+                                                     KinematicFeatures.create_bearing_column)
 
     @staticmethod
     def create_rate_of_br_column(dataframe: PTRAILDataFrame):
@@ -726,38 +578,54 @@ class KinematicFeatures:
                 PTRAILDataFrame:
                     The dataframe containing the resultant Rate_of_bearing_rate_from_prev column
         """
-        # Try catch to check for Bearing Rate column
-        try:
-            # If Bearing from previous column is present, extract that and then calculate time_deltas
-            # Using these calculate Bearing_rate_from_prev by dividing bearing_deltas with time_deltas
-            # And then adding the column to the dataframe
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
-            bearing_rate_deltas = dataframe.reset_index()['Bearing_Rate'].diff()
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
-
-            dataframe['Rate_of_bearing_rate'] = (bearing_rate_deltas / time_deltas).to_numpy()
-            dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
-            return PTRAILDataFrame(data_set=dataframe.reset_index(),
-                                   datetime='DateTime',
-                                   traj_id='traj_id',
-                                   latitude='lat',
-                                   longitude='lon')
-        except KeyError:
-            # Similar to the step above but just makes the Bearing column first
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
-            dataframe = KinematicFeatures.create_bearing_rate_column(dataframe)
-            bearing_rate_deltas = dataframe.reset_index()['Bearing'].diff()
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
-
-            dataframe['Rate_of_bearing_rate'] = (bearing_rate_deltas / time_deltas).to_numpy()
-            dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
-            return PTRAILDataFrame(data_set=dataframe.reset_index(),
-                                   datetime='DateTime',
-                                   traj_id='traj_id',
-                                   latitude='lat',
-                                   longitude='lon')
+        return KinematicFeatures._rate_column_helper(dataframe, 'Bearing_Rate', 'Rate_of_bearing_rate',
+                                                     KinematicFeatures.create_bearing_rate_column)
+
+    @staticmethod
+    def _rate_column_helper(dataframe: PTRAILDataFrame, column: Text, rate_column: Text, create_column):
+        """
+            Calculate the rate of change of the given column between the consecutive points
+            by dividing its deltas with the time deltas and assign it to the dataframe.
+
+            Note
+            ----
+                If the given column is not present in the dataframe, then it is created first
+                using the create_column function.
+
+            Parameters
+            ----------
+                dataframe: PTRAILDataFrame
+                    The dataframe on which the calculation is to be done.
+                column: Text
+                    The column whose rate of change is to be calculated.
+                rate_column: Text
+                    The name of the resultant rate column.
+                create_column:
+                    The function used to create the column if it is not present.
+
+            Returns
+            -------
+                PTRAILDataFrame:
+                    The dataframe containing the resultant rate column.
+        """
+        # Reset the index only once and create the column beforehand if it is not present
+        # instead of catching the KeyError and resetting the index all over again.
+        if column not in dataframe.columns:
+            dataframe = create_column(dataframe)
+        dataframe = dataframe.reset_index()
+
+        values = dataframe[column].to_numpy(dtype=np.float64)
+        prev_positions = helpers._get_previous_positions(pd.factorize(dataframe[const.TRAJECTORY_ID])[0])
+        time_deltas = helpers._get_time_deltas(dataframe, prev_positions)
+
+        # The values yielded by division by a time delta of 0 are set to NaN.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rates = helpers._get_consecutive_diff(values, prev_positions) / time_deltas
+        rates[np.isinf(rates)] = np.nan
+
+        dataframe[rate_column] = rates
+        return PTRAILDataFrame(dataframe, const.LAT, const.LONG,
+                               const.DateTime, const.TRAJECTORY_ID)
 
     @staticmethod
     def get_distance_travelled_by_traj_id(dataframe: PTRAILDataFrame, traj_id: Text):
@@ -827,22 +695,10 @@ class KinematicFeatures:
         """
         dataframe = dataframe.reset_index()
         if traj_id is None:
-            ids_ = dataframe[const.TRAJECTORY_ID].value_counts(ascending=True).keys().to_list()
-            # Get the ideal number of IDs by which the dataframe is to be split.
-            split_factor = helpers._get_partition_size(len(ids_))
-            ids_ = [ids_[i: i + split_factor] for i in range(0, len(ids_), split_factor)]
-
-            # Here, create 2/3rds number of processes as there are in the system. Some CPUs are
-            # kept free at all times in order to not block up the system.
-            # (Note: The blocking of system is mostly prevalent in Windows and does not happen very often
-            # in Linux. However, out of caution some CPUs are kept free regardless of the system.)
-            mp_pool = multiprocessing.Pool(NUM_CPU)
-            results = mp_pool.starmap(helpers.number_of_location_helper, zip(itertools.repeat(dataframe), ids_))
-            mp_pool.close()
-            mp_pool.join()
-
-            # Concatenate all the smaller dataframes and return the answer.
-            results = pd.concat(results)
+            # Count the unique (lat, lon) pairs of every trajectory with a single groupby
+            # instead of counting them for each trajectory separately and concatenating.
+            coords = dataframe[[const.TRAJECTORY_ID, const.LAT, const.LONG]].dropna().drop_duplicates()
+            results = coords.groupby(const.TRAJECTORY_ID).size().to_frame("Number of Unique Coordinates")
             return results
 
         else:
@@ -3,6 +3,7 @@ import unittest
 import numpy as np
 import pandas as pd
 from ptrail.core.TrajectoryDF import PTRAILDataFrame
+from ptrail.features.helper_functions import Helpers
 from ptrail.features.kinematic_features import KinematicFeatures
 import ptrail.utilities.constants as const
 from ptrail.utilities.exceptions import MissingTrajIDException
@@ -25,6 +26,11 @@ class KinematicFeaturesTest(unittest.TestCase):
         self.assertGreaterEqual(bb[2], bb[0])
         self.assertGreaterEqual(bb[3], bb[1])
 
+    def test_get_bb_empty(self):
+        bb = KinematicFeatures.get_bounding_box(self._test_df.iloc[:0])
+        self.assertEqual(len(bb), 4)
+        self.assertTrue(np.isnan(bb).all())
+
     def test_get_start_location(self):
         new_df = KinematicFeatures.get_start_location(self._test_df)
         if len(new_df) > 1:
@@ -166,6 +172,51 @@ class KinematicFeaturesTest(unittest.TestCase):
                 assert np.isnan(filt_df['Rate_of_bearing_rate'].iloc[1])
                 self.assertIsInstance(filt_df['Rate_of_bearing_rate'].iloc[2], float)
 
+    def test_rate_of_bearing_rate_values(self):
+        new_df = KinematicFeatures.create_rate_of_br_column(self._test_df).reset_index()
+
+        # Within each trajectory, the rate of bearing rate must be the change in the bearing
+        # rate divided by the time difference between the consecutive points.
+        for traj_id, filt_df in new_df.groupby(const.TRAJECTORY_ID):
+            bearing_rate = filt_df['Bearing_Rate'].to_numpy()
+            time_deltas = filt_df[const.DateTime].diff().dt.total_seconds().to_numpy()
+            with np.errstate(divide='ignore', invalid='ignore'):
+                expected = (bearing_rate[1:] - bearing_rate[:-1]) / time_deltas[1:]
+            expected[np.isinf(expected)] = np.nan
+
+            np.testing.assert_allclose(filt_df['Rate_of_bearing_rate'].to_numpy()[1:], expected,
+                                       rtol=1e-9, equal_nan=True)
+
+    def test_interleaved_trajectories(self):
+        # Two trajectories whose points alternate with each other in the dataframe.
+        data = pd.DataFrame({'traj_id': ['a', 'b', 'a', 'b', 'a', 'b'],
+                             'DateTime': pd.to_datetime(['2020-01-01 00:00', '2020-01-01 00:01',
+                                                         '2020-01-01 00:02', '2020-01-01 00:03',
+                                                         '2020-01-01 00:05', '2020-01-01 00:06']),
+                             'lat': [47.50, 10.00, 47.51, 10.02, 47.53, 10.01],
+                             'lon': [-52.70, 20.00, -52.71, 20.01, -52.69, 20.03]})
+        keys = [const.TRAJECTORY_ID, const.DateTime]
+
+        # The values calculated on the dataframe sorted by the trajectory IDs.
+        sorted_df = PTRAILDataFrame(data.copy(), 'lat', 'lon', 'DateTime', 'traj_id')
+        expected = KinematicFeatures.create_bearing_column(
+            KinematicFeatures.create_speed_column(sorted_df)).reset_index().set_index(keys)
+
+        # The values calculated on the interleaved dataframe directly.
+        distance = Helpers.distance_between_consecutive_helper(data.copy()).set_index(keys)
+        bearing = Helpers.bearing_helper(data.copy()).set_index(keys)
+        speed = KinematicFeatures._kinematic_columns_helper(data.copy(), ['Distance', 'Speed']).reset_index()
+        speed = speed.set_index(keys)
+
+        for col, result in [('Distance', distance), ('Speed', speed), ('Bearing', bearing)]:
+            values = result.loc[expected.index, col].to_numpy()
+            np.testing.assert_allclose(values, expected[col].to_numpy(), equal_nan=True)
+
+            # The first point of each of the trajectories must be NaN.
+            self.assertTrue(np.isnan(result.loc[('a', data['DateTime'][0]), col]))
+            self.assertTrue(np.isnan(result.loc[('b', data['DateTime'][1]), col]))
+            self.assertEqual(2, np.isnan(values).sum())
+
     def test_distance_travelled_by_traj_id_positive(self):
         dist = KinematicFeatures.get_distance_travelled_by_traj_id(dataframe=self._test_df,
                                                                    traj_id='91732')
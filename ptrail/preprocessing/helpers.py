@@ -28,7 +28,6 @@ from typing import Text, Union
 
 import numpy as np
 import pandas as pd
-import datetime as dt
 from hampel import hampel
 from scipy.interpolate import CubicSpline
 
@@ -402,123 +401,17 @@ class Helpers:
 
     # ------------------------------------------ Statistics Helpers ----------------------------------- #
     @staticmethod
-    def split_traj_helper(df, num_days):
-        # First, create the date column and get all the unique traj_ids
-        # in the dataframe.
-        df['Date'] = df[const.DateTime].dt.date
-        ids_ = list(df.traj_id.value_counts().keys())
-
-        df_chunks = []
-        for i in range(len(ids_)):
-            small_df = df.reset_index().loc[df.reset_index()[const.TRAJECTORY_ID] == ids_[i]]
-            df_chunks.append(small_df)
-
-        # Now, iterate over the entire dataframe and then segment
-        # the trajectories by num_days each.
-        results = []
-        for i in range(len(ids_)):
-            # Take the traj_df of a single Trajectory out from the
-            # list of chunks and find their max and min timestamps.
-            traj = df_chunks[i]
-            t_max = traj[const.DateTime].max()
-            t_min = traj[const.DateTime].min()
-
-            # For iteration purposes, set t_1 to min and t_2 to
-            # t_1 + num_days days.
-            t_1 = t_min
-            t_2 = t_1 + dt.timedelta(days=num_days)
-            seg_id = 1
-
-            # Now, segment the trajectories into smaller segments
-            # wherein each segment contains the points of a span
-            # of num_days days only.
-            while t_2 < t_max:
-                if t_2 < t_max:
-                    seg = Helpers.filt_df_by_date(traj,
-                                                  start_date=t_1.strftime('%Y-%m-%d'),
-                                                  end_date=t_max.strftime('%Y-%m-%d'))
-                    # Once filtered, assign the segment with a segment ID.
-                    seg['seg_id'] = seg_id
-
-                    # Increment the segment id, t_1 and t_2 values by
-                    # 1, num_days days each respectively to continue the iteration.
-                    t_1 += dt.timedelta(days=num_days)
-                    t_2 += dt.timedelta(days=num_days)
-
-                    if len(seg) > 0:
-                        seg_id += 1
-
-                    results.append(seg.drop(columns=['index', 'level_0']))
-
-                # If, t_2 is greater than the max time present in the
-                # trajectory, then assign t_2 = max and proceed
-                # further with segmentation.
-                elif t_2 >= t_max:
-                    seg = Helpers.filt_df_by_date(traj,
-                                                  start_date=t_1.strftime('%Y-%m-%d'),
-                                                  end_date=t_max.strftime('%Y-%m-%d'))
-                    # Once filtered, assign the segment with a segment ID.
-                    seg['seg_id'] = seg_id
-
-                    # Increment the segment id, t_1 and t_2 values by
-                    # 1, num_days each respectively to continue the iteration.
-                    t_1 += dt.timedelta(days=num_days)
-                    t_2 += dt.timedelta(days=num_days)
-
-                    if len(seg) > 0:
-                        seg_id += 1
-
-                    results.append(seg.drop(columns=['index', 'level_0']))
-                    seg_id += 1
-
-        # Finally, concat the dataframes, set the index as
-        # [traj_id, seg_id, DateTime].
-        return pd.concat(results).reset_index().set_index(['traj_id', 'seg_id', 'DateTime']).sort_values(by=['traj_id',
-                                                                                                             'seg_id'])
-
-    @staticmethod
-    def filt_df_by_date(dataframe, start_date, end_date):
-        # Convert the user-given string dates to pandas datetime format.
-        start_date = pd.to_datetime(start_date) if start_date is not None else None
-        end_date = pd.to_datetime(end_date) if end_date is not None else None
-
-        # Case-1: No start and end date are give. Hence just return the original dataframe.
-        if start_date is None and end_date is None:
-            filtered_df = dataframe
-
-        # Case-2: No start_date is given. Hence, return all the points upto and including
-        #         the points on the end date.
-        elif start_date is None and end_date is not None:
-            filt = dataframe['Date'] <= end_date
-            filtered_df = dataframe.loc[filt]
-
-        # Case-3: No end date is given. Hence, return all the point after and including the
-        #         points on the start date.
-        elif start_date is not None and end_date is None:
-            filt = dataframe['Date'] >= start_date
-            filtered_df = dataframe.loc[filt]
-
-        # Case-4: Both the start date and end date are given. Hence, return the points between
-        #         and including the points on start and end date.
-        else:
-            if end_date < start_date:
-                raise ValueError(f"End Date should be later than Start Date.")
-            else:
-                filt = np.logical_and(dataframe['Date'] >= start_date, dataframe['Date'] <= end_date)
-                filtered_df = dataframe.loc[filt].reset_index()
-
-        # Convert the smaller dataframe back to PTRAILDataFrame and return it.
-        return filtered_df
-
-    @staticmethod
-    def stats_helper(df, target_col_name, segmented):
+    def stats_helper(features, target_col_name, segmented):
         """
-            Generate the stats of the kinematic features present in the Dataframe.
+            Generate the stats of the kinematic features of a single trajectory
+            (or a single segment of a trajectory).
 
             Parameters
             ----------
-                df: pandas.core.dataframe.DataFrame
-                    The dataframe containing the trajectory data and their features.
+                features: dict
+                    The values of the const.STATS_COLS kinematic features of the points
+                    of the trajectory as numpy arrays along with the traj_id, the value
+                    of the target column and the seg_id if the trajectory is segmented.
                 target_col_name: str
                     This is the 'y' value that is used for ML tasks, this is
                     asked to append the species back at the end.
@@ -531,44 +424,21 @@ class Helpers:
                     A dataframe containing the stats of the given trajectory.
 
         """
-        # Grab the columns that we need.
-        if not segmented:
-            new_df = df.reset_index()[['traj_id', 'Distance', 'Distance_from_start', 'Speed',
-                                       'Acceleration', 'Jerk', 'Bearing', 'Bearing_Rate',
-                                       'Rate_of_bearing_rate']]
-            # Generate the stats along with the needed percentiles and arrange the dataframe
-            # properly.
-            stats = new_df.reset_index(drop=True).describe(percentiles=[0.1, 0.25, 0.5, 0.75, 0.9]).transpose()
-
-            # Assign the traj_id column.
-            stats['traj_id'] = new_df['traj_id'].iloc[0]
-            stats = stats[['traj_id', 'mean', 'std', 'min', '10%',
-                           '25%', '50%', '75%', '90%', 'max']]
-            stats[target_col_name] = df[target_col_name].iloc[0]
-
-            return stats.reset_index().rename(
-                columns={'index': 'Columns'}).reset_index(drop=True).set_index(['traj_id', 'Columns'])
-        else:
-            seg_id = df['seg_id'].iloc[0]
-            new_df = df.reset_index()[['traj_id', 'Distance', 'Distance_from_start', 'Speed',
-                                       'Acceleration', 'Jerk', 'Bearing', 'Bearing_Rate',
-                                       'Rate_of_bearing_rate']]
-
-            # Generate the stats along with the needed percentiles and arrange the dataframe
-            # properly.
-            stats = new_df.reset_index(drop=True).describe(percentiles=[0.1, 0.25, 0.5, 0.75, 0.9]).transpose()
-
-            # Assign the traj_id column.
-            stats['traj_id'] = new_df['traj_id'].iloc[0]
-            stats['seg_id'] = seg_id
-            stats = stats[['traj_id', 'seg_id', 'mean', 'std', 'min', '10%',
-                           '25%', '50%', '75%', '90%', 'max']]
-            stats[target_col_name] = df[target_col_name].iloc[0]
-            stats = stats.loc[:, ~stats.columns.duplicated()]
-
-            to_return = stats.reset_index().rename(
-                columns={'index': 'Columns'}).reset_index(drop=True).set_index(['traj_id', 'seg_id', 'Columns'])
-            return to_return
+        # Generate the stats along with the needed percentiles and arrange the dataframe
+        # properly.
+        new_df = pd.DataFrame({col: features[col] for col in const.STATS_COLS})
+        stats = new_df.describe(percentiles=[0.1, 0.25, 0.5, 0.75, 0.9]).transpose()
+
+        # Assign the traj_id column (and the seg_id column if the trajectory is segmented).
+        index_cols = ['traj_id', 'seg_id'] if segmented else ['traj_id']
+        for col in index_cols:
+            stats[col] = features[col]
+        stats = stats[index_cols + ['mean', 'std', 'min', '10%', '25%', '50%', '75%', '90%', 'max']]
+        stats[target_col_name] = features[target_col_name]
+        stats = stats.loc[:, ~stats.columns.duplicated()]
+
+        return stats.reset_index().rename(
+            columns={'index': 'Columns'}).reset_index(drop=True).set_index(index_cols + ['Columns'])
 
     # -------------------------------------- General Utilities ---------------------------------- #
     @staticmethod
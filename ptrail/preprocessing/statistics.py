@@ -45,21 +45,20 @@ class Statistics:
                     The dataframe containing segmented trajectories
                     with a new column added called segment_id
         """
-        # splitting the dataframe according to trajectory ids
-        df_chunks = helpers._df_split_helper(dataframe=dataframe.reset_index())
+        # First, bucket all the points by their date and find the first date of the
+        # trajectory that each of the points belongs to.
+        dataframe = dataframe.reset_index()
+        days = pd.Series(dataframe[const.DateTime].to_numpy().astype('datetime64[D]'))
+        traj_ids = dataframe[const.TRAJECTORY_ID].to_numpy()
+        start_days = days.groupby(traj_ids, sort=False).transform('min')
 
-        # Here, create 2/3rds number of processes as there are in the system. Some CPUs are
-        # kept free at all times in order to not block up the system.
-        # (Note: The blocking of system is mostly prevalent in Windows and does not happen very often
-        # in Linux. However, out of caution some CPUs are kept free regardless of the system.)
-        pool = multiprocessing.Pool(NUM_CPU)
-        results = pool.starmap(helpers.split_traj_helper, zip(df_chunks, itertools.repeat(num_days)))
-        pool.close()
-        pool.join()
+        # Now, assign each point to the window of num_days days that it lies in counting from
+        # the start of its trajectory. The windows are then numbered consecutively within each
+        # trajectory so that windows without any points do not leave gaps in the segment IDs.
+        windows = pd.Series((days - start_days).dt.days.to_numpy() // num_days)
+        dataframe['seg_id'] = windows.groupby(traj_ids, sort=False).rank(method='dense').astype(int).to_numpy()
 
-        to_return = pd.concat(results).reset_index().set_index(['traj_id', 'seg_id', 'DateTime'])
-
-        return to_return.drop(columns=['index'])
+        return dataframe.set_index([const.TRAJECTORY_ID, 'seg_id', const.DateTime]).sort_index()
 
     @staticmethod
     def generate_kinematic_stats(dataframe: PTRAILDataFrame, target_col_name: str, segmented: Optional[bool] = False):
@@ -87,35 +86,39 @@ class Statistics:
         ptdf = KinematicFeatures.generate_kinematic_features(dataframe)
 
         # Then, lets break down the entire dataframe into pieces containing data of
-        # 1 trajectory in each piece.
-        ids_ = list(dataframe.reset_index().traj_id.value_counts().keys())
-        df_chunks = []
-
-        if segmented:
-            segments = ptdf.reset_index()['seg_id'].unique()
-            for i in range(len(ids_)):
-                for seg in segments:
-                    df = ptdf.reset_index().loc[(ptdf.reset_index()['traj_id'] == ids_[i])
-                                                & (ptdf.reset_index()['seg_id'] == seg)]
-                    if len(df) > 0:
-                        df_chunks.append(df)
-                    else:
-                        continue
+        # 1 trajectory (or 1 segment of a trajectory) in each piece. The positions of
+        # the rows of each piece are found with a single groupby instead of scanning
+        # the entire dataframe once for every trajectory. Instead of a dataframe, each
+        # piece only contains the slices of the numpy arrays of the needed features
+        # along with the IDs and the target value, which are much cheaper to send to
+        # the other processes.
+        ptdf = ptdf.reset_index()
+        group_cols = [const.TRAJECTORY_ID, 'seg_id'] if segmented else [const.TRAJECTORY_ID]
+        arrays = {col: ptdf[col].to_numpy() for col in const.STATS_COLS}
+        labels = {col: ptdf[col].to_numpy() for col in group_cols + [target_col_name]}
+        groups = ptdf.groupby(group_cols, sort=False).indices
+        df_chunks = [{**{col: values[idx] for col, values in arrays.items()},
+                      **{col: values[idx[0]] for col, values in labels.items()}}
+                     for idx in groups.values()]
+
+        # Case-1: The number of pieces is less than 100. Hence, the overhead of sending
+        #         the pieces to other processes outweighs the gain and the stats are
+        #         calculated serially.
+        if len(df_chunks) < const.MIN_IDS:
+            results = [helpers.stats_helper(chunk, target_col_name, segmented) for chunk in df_chunks]
+
+        # Case-2: The number of pieces is significant.
         else:
-            for i in range(len(ids_)):
-                small_df = ptdf.reset_index().loc[ptdf.reset_index()[const.TRAJECTORY_ID] == ids_[i]]
-                df_chunks.append(small_df)
-
-        # Here, create 2/3rds number of processes as there are in the system. Some CPUs are
-        # kept free at all times in order to not block up the system.
-        # (Note: The blocking of system is mostly prevalent in Windows and does not happen very often
-        # in Linux. However, out of caution some CPUs are kept free regardless of the system.)
-        mp_pool = multiprocessing.Pool(NUM_CPU)
-        results = mp_pool.starmap(helpers.stats_helper, zip(df_chunks,
-                                                            itertools.repeat(target_col_name),
-                                                            itertools.repeat(segmented)))
-        mp_pool.close()
-        mp_pool.join()
+            # Here, create 2/3rds number of processes as there are in the system. Some CPUs are
+            # kept free at all times in order to not block up the system.
+            # (Note: The blocking of system is mostly prevalent in Windows and does not happen very often
+            # in Linux. However, out of caution some CPUs are kept free regardless of the system.)
+            mp_pool = multiprocessing.Pool(min(NUM_CPU, len(df_chunks)))
+            results = mp_pool.starmap(helpers.stats_helper, zip(df_chunks,
+                                                                itertools.repeat(target_col_name),
+                                                                itertools.repeat(segmented)))
+            mp_pool.close()
+            mp_pool.join()
 
         return pd.concat(results)
 
@@ -145,56 +148,24 @@ class Statistics:
                 pd.core.dataframe.DataFrame:
                     The dataframe above which is pivoted and has rows converted to columns.
         """
-        # Get all the unique trajectory IDs.
-        ids_ = list(dataframe.index.get_level_values('traj_id').unique())
-
-        final_chunks = []
-        if not segmented:
-            for val in ids_:
-                # separated the data for each trajectory id.
-                small = dataframe.loc[dataframe.index.get_level_values('traj_id') == val].reset_index().set_index(
-                    'traj_id')
-
-                # Get the target value out and drop the target column.
-                target = small[target_col_name].iloc[0]
-                small = small.drop(columns=[target_col_name])
-
-                # Pivot the table now and adjust the column names.
-                pivoted = small.reset_index().pivot_table(index='traj_id', columns='Columns')
-                pivoted.columns = pivoted.columns.map('_'.join).str.strip('|')
-
-                # Assign the target column again.
-                pivoted[target_col_name] = target
-                final_chunks.append(pivoted)
-        else:
-            for val in ids_:
-                segments = dataframe.index.get_level_values('seg_id').unique()
-                for seg in segments:
-                    small = dataframe.loc[(dataframe.index.get_level_values('traj_id') == val) &
-                                          (dataframe.index.get_level_values('seg_id') == seg)].reset_index().set_index(['traj_id', 'seg_id'])
-
-                    if len(small) <= 0:
-                        continue
-
-                    # Get the target value out and drop the target column.
-                    target = small[target_col_name].iloc[0]
-                    small = small.drop(columns=[target_col_name])
-
-                    # Pivot the table now and adjust the column names.
-                    pivoted = small.reset_index().pivot_table(index=['traj_id', 'seg_id'], columns='Columns')
-                    pivoted.columns = pivoted.columns.map('_'.join).str.strip('|')
+        # Get the target value of each trajectory (or segment) out and drop the target column.
+        index_cols = ['traj_id', 'seg_id'] if segmented else 'traj_id'
+        flat = dataframe.reset_index()
+        target = flat.groupby(index_cols, sort=False)[target_col_name].first()
+        flat = flat.drop(columns=[target_col_name])
 
-                    # Assign the target column again.
-                    pivoted[target_col_name] = target
-                    final_chunks.append(pivoted)
+        # Pivot the entire table at once and adjust the column names.
+        to_return = flat.pivot_table(index=index_cols, columns='Columns')
+        to_return.columns = to_return.columns.map('_'.join).str.strip('|')
 
-        # Concatenate the smaller chunks and reorder the columns.
-        to_return = pd.concat(final_chunks)
+        # Assign the target column again.
+        to_return[target_col_name] = target
 
         # Store the correct order of the columns to a variable and add the name
         # of the target column to the end of it.
-        cols = const.ORDERED_COLS
-        cols.append(target_col_name)
+        # (Note: A new list is created here as appending to const.ORDERED_COLS directly would
+        # modify the module-level constant itself on every call.)
+        cols = list(const.ORDERED_COLS) + [target_col_name]
 
         # Reorder the final DF, drop duplicated columns and return it.
         to_return = to_return[cols]
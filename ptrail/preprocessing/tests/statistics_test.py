@@ -0,0 +1,56 @@
+import unittest
+from ptrail.core.TrajectoryDF import PTRAILDataFrame
+from ptrail.preprocessing.statistics import Statistics
+import ptrail.utilities.constants as const
+import pandas as pd
+
+
+class StatisticsTest(unittest.TestCase):
+    _pdf_data = pd.read_csv('https://raw.githubusercontent.com/YakshHaranwala/PTRAIL/main/examples/data/seagulls.csv')
+    _test_df = PTRAILDataFrame(data_set=_pdf_data,
+                               latitude='location-lat',
+                               longitude='location-long',
+                               datetime='timestamp',
+                               traj_id='tag-local-identifier',
+                               rest_of_columns=[])
+    _target = 'individual-taxon-canonical-name'
+
+    def test_pivot_stats_df(self):
+        stats = Statistics.generate_kinematic_stats(self._test_df, self._target)
+        pivoted = Statistics.pivot_stats_df(stats, self._target)
+        self.assertEqual(len(const.ORDERED_COLS) + 1, len(pivoted.columns))
+        self.assertEqual(self._target, pivoted.columns[-1])
+
+    def test_pivot_stats_df_ordered_cols_unchanged(self):
+        num_cols = len(const.ORDERED_COLS)
+        stats = Statistics.generate_kinematic_stats(self._test_df, self._target)
+
+        # Pivot the stats repeatedly and make sure that the module-level
+        # column order constant does not grow with every call.
+        for i in range(3):
+            Statistics.pivot_stats_df(stats, self._target)
+            self.assertEqual(num_cols, len(const.ORDERED_COLS))
+
+    def test_segment_traj_by_days(self):
+        # Trajectory a has points in the 1st, 2nd and 4th 7-day windows counted from its first
+        # day, whereas trajectory b starts on a different day and has points in its first 2 windows.
+        data = pd.DataFrame({'traj_id': ['a', 'a', 'a', 'a', 'b', 'b'],
+                             'DateTime': pd.to_datetime(['2020-01-01 10:00', '2020-01-02 23:00',
+                                                         '2020-01-08 01:00', '2020-01-25 12:00',
+                                                         '2020-01-05 08:00', '2020-01-13 08:00']),
+                             'lat': [47.0, 47.1, 47.2, 47.3, 48.0, 48.1],
+                             'lon': [-52.0, -52.1, -52.2, -52.3, -53.0, -53.1]})
+        segmented = Statistics.segment_traj_by_days(
+            PTRAILDataFrame(data, 'lat', 'lon', 'DateTime', 'traj_id'), 7)
+
+        self.assertEqual([const.TRAJECTORY_ID, 'seg_id', const.DateTime], list(segmented.index.names))
+
+        # The empty 3rd window of trajectory a gets no ID, hence its 4th window gets the ID 3.
+        seg_ids = segmented.reset_index().groupby(const.TRAJECTORY_ID)['seg_id'].apply(list)
+        self.assertEqual([1, 1, 2, 3], seg_ids['a'])
+        self.assertEqual([1, 2], seg_ids['b'])
+        self.assertEqual(len(data), len(segmented))
+
+
+if __name__ == '__main__':
+    unittest.main()
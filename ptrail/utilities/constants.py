@@ -29,8 +29,11 @@ PREV_DIST = 'Distance_prev_to_curr'
 
 # ---------------------------------- Splitting Constants -----------------------------------------#
 MIN_IDS = 100
+MIN_POINTS_PER_THREAD = 100000
 
 # ---------------------------------- Stats Constants --------------------------------------------- #
+STATS_COLS = ['Distance', 'Distance_from_start', 'Speed', 'Acceleration', 'Jerk',
+              'Bearing', 'Bearing_Rate', 'Rate_of_bearing_rate']
 ORDERED_COLS = [
     '10%_Distance', '25%_Distance', '50%_Distance', '75%_Distance', '90%_Distance', 'min_Distance', 'max_Distance', 'mean_Distance', 'std_Distance',
     '10%_Distance_from_start', '25%_Distance_from_start', '50%_Distance_from_start', '75%_Distance_from_start', '90%_Distance_from_start', 'min_Distance_from_start', 'max_Distance_from_start','mean_Distance_from_start', 'std_Distance_from_start',
@@ -1,5 +1,7 @@
+from setuptools import Extension
 from setuptools import find_packages
 from setuptools import setup
+from setuptools.command.build_ext import build_ext
 
 with open('README.md', 'r') as f:
     LONG_DESCRIPTION = f.read()
@@ -21,6 +23,37 @@ REQUIRED_PKGS = ['numpy >= 1.20',
                  'scikit-learn'
                  ]
 
+# The haversine kernels fall back to plain NumPy when neither of these is installed.
+EXTRA_PKGS = {'numba': ['numba >= 0.53'],
+              'numexpr': ['numexpr >= 2.7']}
+
+
+class OptionalBuildExt(build_ext):
+    """
+        Build the optional C extensions and warn instead of failing the installation
+        if they cannot be built, in which case PTRAIL uses the other kernel backends.
+    """
+    def run(self):
+        try:
+            super().run()
+        except Exception as e:
+            print(f"WARNING: The optional C extensions could not be built: {e}")
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except Exception as e:
+            print(f"WARNING: The optional C extension {ext.name} could not be built: {e}")
+
+
+# The Cython haversine kernels are built only if Cython is available.
+try:
+    from Cython.Build import cythonize
+    EXT_MODULES = cythonize([Extension('ptrail.features._cython_kernels',
+                                       ['ptrail/features/_cython_kernels.pyx'])])
+except ImportError:
+    EXT_MODULES = []
+
 setup(
     name='ptrail',
     packages=find_packages(),
@@ -42,6 +75,9 @@ setup(
                  'Programming Language :: Python :: 3',
                  ],
     install_requires=REQUIRED_PKGS,
+    extras_require=EXTRA_PKGS,
+    ext_modules=EXT_MODULES,
+    cmdclass={'build_ext': OptionalBuildExt},
     url='https://github.com/YakshHaranwala/PTRAIL.git',
     include_package_data=True,
 )